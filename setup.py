@@ -23,5 +23,10 @@ setuptools.setup(
     install_requires=[
         "requests",
         "typing"
-    ]
+    ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "http2": ["httpx[http2]"]
+    }
 )
\ No newline at end of file
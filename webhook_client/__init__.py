@@ -1,4 +1,5 @@
 from .client import *
+from .async_client import *
 from .errors import *
 from .colour import *
 from .embed import *
@@ -0,0 +1,146 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .errors import WebhookError, InvalidWebhook, RateLimited
+from .base import BaseWebhookClient, MAX_EMBEDS, _INVALID_STATUSES, _JSON_HEADERS, _RATE_LIMIT_RETRIES, _to_json
+
+__all__ = (
+    'AsyncWebhookClient',
+)
+
+class AsyncWebhookClient(BaseWebhookClient):
+    def __init__(self, webhook_url: str, username: str = None, avatar_url: str = None, session: 'aiohttp.ClientSession' = None, validate: bool = False):
+        """ Create an AsyncWebhookClient instance. Requires ``aiohttp``.
+        :param webhook_url: the webhook url the client connects to
+        :param username: (optional) the username the webhook should have
+        :param avatar_url: (optional) the avatar url the webhook should have
+        :param session: (optional) an :class:`aiohttp.ClientSession` to share between clients
+        :param validate: (optional) check the webhook before the first send. Defaults to `False`."""
+        if aiohttp is None:
+            raise WebhookError('aiohttp is required to use AsyncWebhookClient: pip install webhook-client[async]')
+        super().__init__(webhook_url, username, avatar_url)
+        self._session = session
+        self._owns_session = session is None
+        self._checked = not validate
+        self._flush_task = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if not self._owns_session:
+            if self._session.closed:
+                raise WebhookError('The session passed to AsyncWebhookClient has been closed.')
+            return self._session
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """ Flush any batched messages, then close the underlying session unless it was passed in as ``session``. """
+        try:
+            if self._flush_task is not None:
+                await asyncio.wait([self._flush_task])
+            await self.flush()
+        finally:
+            if self._owns_session and self._session is not None and not self._session.closed:
+                await self._session.close()
+
+    async def check_webhook(self, webhook_url):
+        async with self._get_session().head(str(webhook_url), allow_redirects=False) as r:
+            if r.status in [200, 204]:
+                pass
+            else:
+                raise InvalidWebhook('The webhook you provided is invalid.')
+        self._checked = True
+
+    async def send(self, content: str = None, embeds: list = None, tts: bool = False, thread_id: int = None):
+        """ Send a message to your AsyncWebhookClient.
+        
+        
+        content: :class:`str`
+            The content for the message.
+        embeds: :class:`list`
+            List of `Embed`s to send in the message.
+        tts: :class:`bool`
+            Whether or not the message should be sent as text-to-speech. Defaults to `False`.
+        thread_id: :class:`int`
+            The thread ID that the webhook should be posted in. Defaults to `None`.
+
+        Rate limited requests are retried after the delay Discord asks for, raising
+        :class:`RateLimited` if they are still limited after 3 retries. """
+        if not self._checked:
+            await self.check_webhook(self.webhook_url)
+        json_data = self.build_json(self.webhook_url, content, embeds, self.username, self.avatar_url, tts)
+        query_str = self.build_query(self.webhook_url, thread_id)
+        body = _to_json(json_data)
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            delay = self._bucket_delay(query_str)
+            if delay:
+                await asyncio.sleep(delay)
+            async with self._get_session().post(query_str, data=body, headers=_JSON_HEADERS) as r:
+                self._update_bucket(query_str, r.headers)
+                if r.status in _INVALID_STATUSES:
+                    raise InvalidWebhook('The webhook you provided is invalid.')
+                if r.status != 429:
+                    await r.read()
+                    return
+                if attempt == _RATE_LIMIT_RETRIES:
+                    raise RateLimited('The webhook is being rate limited.')
+                try:
+                    data = await r.json(content_type=None)
+                except ValueError:
+                    data = None
+                retry_after = self._retry_after(r.headers, data)
+            await asyncio.sleep(retry_after)
+
+    async def send_batched(self, content: str = None, embeds: list = None, thread_id: int = None, flush_after_ms: int = 50, max_embeds: int = MAX_EMBEDS):
+        """ Buffer a message so it can be sent together with other messages in one request.
+        See :meth:`WebhookClient.send_batched`; the timed flush runs as a task on the running loop. """
+        error = self._take_flush_error()
+        if error is not None:
+            raise error
+        for batch_content, batch_embeds, batch_thread in self._queue(content, embeds, thread_id, max_embeds):
+            await self.send(batch_content, embeds=batch_embeds, thread_id=batch_thread)
+        with self._pending_lock:
+            if self._batch_depth or self._flush_timer is not None or not self._pending:
+                return
+            self._flush_timer = asyncio.get_running_loop().call_later(flush_after_ms / 1000, self._start_background_flush)
+
+    def _start_background_flush(self):
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_task.add_done_callback(self._background_flush_done)
+
+    def _background_flush_done(self, task):
+        if self._flush_task is task:
+            self._flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self._flush_error = task.exception()
+
+    async def flush(self):
+        """ Send every message buffered by :meth:`send_batched`, then raise any error from an earlier background flush. """
+        for batch_content, batch_embeds, batch_thread in self._drain():
+            await self.send(batch_content, embeds=batch_embeds, thread_id=batch_thread)
+        error = self._take_flush_error()
+        if error is not None:
+            raise error
+
+    @asynccontextmanager
+    async def batch(self):
+        """ Buffer every :meth:`send_batched` call made inside the ``async with`` block and flush them on exit. """
+        self._enter_batch()
+        try:
+            yield self
+        finally:
+            if self._exit_batch():
+                await self.flush()
@@ -0,0 +1,236 @@
+import json
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .embed import Embed
+
+MAX_EMBEDS = 10
+
+MAX_CONTENT_LENGTH = 2000
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_INVALID_STATUSES = (401, 404)
+
+_RATE_LIMIT_RETRIES = 3
+
+_QUERY_CACHE_SIZE = 64
+
+def _to_json(data) -> bytes:
+    """ Serialize a payload to bytes, using ``orjson`` when it is installed. """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+class _PendingBatch:
+    """ Messages buffered for one thread that fit in a single request. """
+    __slots__ = ('thread_id', 'contents', 'length', 'embeds')
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.contents = []
+        self.length = 0
+        self.embeds = []
+
+    def fits(self, content: str, embed_count: int, max_embeds: int) -> bool:
+        """ Whether a message can join this batch. An empty batch takes any message. """
+        if not self.contents and not self.embeds:
+            return True
+        if len(self.embeds) + embed_count > max_embeds:
+            return False
+        if content and self.contents:
+            return self.length + 1 + len(content) <= MAX_CONTENT_LENGTH
+        return self.length + len(content) <= MAX_CONTENT_LENGTH
+
+    def add(self, content: str, embeds: list):
+        if content:
+            self.length += len(content) + (1 if self.contents else 0)
+            self.contents.append(content)
+        self.embeds.extend(embeds)
+
+    def to_batch(self):
+        return '\n'.join(self.contents) or None, self.embeds, self.thread_id
+
+class BaseWebhookClient:
+    """ Payload building, batching and rate limit bookkeeping shared by
+    :class:`WebhookClient` and :class:`AsyncWebhookClient`. It does no I/O itself. """
+
+    def __init__(self, webhook_url: str, username: str = None, avatar_url: str = None):
+        self.webhook_url = webhook_url
+        self.username = username
+        self.avatar_url = avatar_url
+        self._init_batching()
+        self._init_rate_limits()
+
+    @property
+    def username(self):
+        return self._username
+
+    @username.setter
+    def username(self, value: str):
+        self._username = value
+        self._json_template = None
+
+    @property
+    def avatar_url(self):
+        return self._avatar_url
+
+    @avatar_url.setter
+    def avatar_url(self, value: str):
+        self._avatar_url = value
+        self._json_template = None
+
+    @property
+    def webhook_url(self):
+        return self._webhook_url
+
+    @webhook_url.setter
+    def webhook_url(self, value: str):
+        self._webhook_url = value
+        self._query_urls = {None: str(value)}
+
+    def _init_batching(self):
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        self._flush_error = None
+        self._batch_depth = 0
+
+    def _enter_batch(self):
+        with self._pending_lock:
+            self._batch_depth += 1
+
+    def _exit_batch(self) -> bool:
+        """ Leave a ``batch()`` block, returning whether it was the outermost one. """
+        with self._pending_lock:
+            self._batch_depth -= 1
+            return not self._batch_depth
+
+    def _init_rate_limits(self):
+        self._route_buckets = {}
+        self._bucket_reset = {}
+
+    def _bucket_delay(self, route):
+        """ Seconds to wait until the rate limit bucket of ``route`` has room again. """
+        bucket = self._route_buckets.get(route)
+        if bucket is None:
+            return 0
+        return max(0, self._bucket_reset.get(bucket, 0) - time.monotonic())
+
+    def _update_bucket(self, route, headers):
+        """ Remember the rate limit bucket of ``route`` and when it resets once exhausted. """
+        bucket = headers.get('X-RateLimit-Bucket')
+        if bucket is None:
+            return
+        self._route_buckets[route] = bucket
+        if headers.get('X-RateLimit-Remaining') != '0':
+            self._bucket_reset.pop(bucket, None)
+            return
+        try:
+            self._bucket_reset[bucket] = time.monotonic() + float(headers['X-RateLimit-Reset-After'])
+        except (KeyError, ValueError):
+            pass
+
+    @staticmethod
+    def _retry_after(headers, data):
+        """ Seconds to wait before retrying a rate limited request. """
+        try:
+            return float(headers['Retry-After'])
+        except (KeyError, ValueError):
+            pass
+        try:
+            return float(data['retry_after'])
+        except (KeyError, TypeError, ValueError):
+            return 1
+
+    def _queue(self, content, embeds, thread_id, max_embeds):
+        """ Buffer a message and return the batches that are ready to send, oldest first.
+        A batch is closed when the next message's content or embeds would not fit in it,
+        so a message is never split between requests. """
+        max_embeds = max(1, min(max_embeds, MAX_EMBEDS))
+        content = str(content) if content else ''
+        embeds = list(embeds) if embeds else []
+        ready = []
+        with self._pending_lock:
+            batch = self._pending.get(thread_id)
+            if batch is not None and not batch.fits(content, len(embeds), max_embeds):
+                ready.append(batch.to_batch())
+                batch = None
+            if batch is None:
+                batch = self._pending[thread_id] = _PendingBatch(thread_id)
+            batch.add(content, embeds)
+            # Full batches, and messages too large to share a request, go out now.
+            if len(batch.embeds) >= max_embeds or batch.length >= MAX_CONTENT_LENGTH:
+                ready.append(batch.to_batch())
+                del self._pending[thread_id]
+        return ready
+
+    def _drain(self):
+        """ Take every buffered message, returning one batch per thread. """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        return [batch.to_batch() for batch in pending.values() if batch.contents or batch.embeds]
+
+    def _take_flush_error(self):
+        """ Return and clear the error raised by the last background flush, if any. """
+        error, self._flush_error = self._flush_error, None
+        return error
+
+    def to_dict(self, embed):
+        if isinstance(embed, (dict)):
+            return embed
+        elif isinstance(embed, (Embed)):
+            return embed._to_dict()
+        else:
+            return {'title': 'Invalid Embed.'}
+
+    @staticmethod
+    def _build_template(username, avatar_url):
+        """ Build the part of the payload that is fixed per client, leaving out unset keys. """
+        template = {}
+        if username:
+            template['username'] = username
+        if avatar_url:
+            template['avatar_url'] = avatar_url
+        return template
+
+    def build_json(self, webhook_url, content: str = None, embeds: list = None, username: str = None, avatar_url: str = None, tts: bool = False):
+        # Embeds that serialize to nothing are dropped rather than sent as ``{}``.
+        embed_list = [data for data in map(self.to_dict, embeds) if data] if embeds else []
+
+        if username is self._username and avatar_url is self._avatar_url:
+            template = self._json_template
+            if template is None:
+                template = self._json_template = self._build_template(username, avatar_url)
+            json_data = template.copy()
+        else:
+            json_data = self._build_template(username, avatar_url)
+        if content:
+            json_data['content'] = content
+        if embed_list:
+            json_data['embeds'] = embed_list
+        if tts:
+            json_data['tts'] = tts
+
+        return json_data
+    
+    def build_query(self, webhook_url: str, thread_id: int = None):
+        if webhook_url is not self._webhook_url:
+            return f"{webhook_url}?thread_id={thread_id}" if thread_id else str(webhook_url)
+        try:
+            return self._query_urls[thread_id]
+        except KeyError:
+            pass
+        query_url = f"{self._query_urls[None]}?thread_id={thread_id}" if thread_id else self._query_urls[None]
+        if len(self._query_urls) >= _QUERY_CACHE_SIZE:
+            self._query_urls = {None: self._query_urls[None]}
+        self._query_urls[thread_id] = query_url
+        return query_url
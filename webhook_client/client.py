@@ -1,62 +1,165 @@
 import requests
 import os
 import json
+import threading
+import time
+import concurrent.futures
 
-from .errors import WebhookError, InvalidWebhook
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .errors import WebhookError, InvalidWebhook, RateLimited
 from .colour import Colour
 from .types import *
 from .embed import Embed
+from .base import BaseWebhookClient, MAX_EMBEDS, _INVALID_STATUSES, _JSON_HEADERS, _RATE_LIMIT_RETRIES, _to_json
+
+def _build_session() -> requests.Session:
+    """ Create a session that pools and keeps alive connections to discord.com. """
+    session = requests.Session()
+    # urllib3 retries failed connections for every method, but status and read retries only for
+    # idempotent ones, so the POST in send is never resent once it has reached Discord.
+    # 429s are left to send's own rate limit handling. raise_on_status=False hands the final
+    # response back so its status is checked like any other instead of raising RetryError.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=retries))
+    return session
+
+def _build_http2_client() -> 'httpx.Client':
+    """ Create a client that multiplexes requests to discord.com over one HTTP/2 connection. """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    # retries only covers failed connection attempts, matching what Retry does for POSTs on the requests path.
+    try:
+        transport = httpx.HTTPTransport(http2=True, retries=3, limits=limits)
+    except ImportError:
+        # httpx raises this when it is installed without the h2 package
+        raise WebhookError('h2 is required to use HTTP/2: pip install webhook-client[http2]') from None
+    return httpx.Client(transport=transport)
+
+_VALIDATE_TIMEOUT = 10
+
+_TRANSPORT_ERRORS = (requests.RequestException,) if httpx is None else (requests.RequestException, httpx.HTTPError)
+
+# Shared by every client so constructing several of them validates their webhooks concurrently.
+_VALIDATE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='webhook-validate')
 
-class WebhookClient:
-    def __init__(self, webhook_url: str, username: str = None, avatar_url: str = None):
+class WebhookClient(BaseWebhookClient):
+    def __init__(self, webhook_url: str, username: str = None, avatar_url: str = None, session: requests.Session = None, validate: bool = False, http2: bool = False):
         """ Create a WebhookClient instance.
         :param webhook_url: the webhook url the client connects to
         :param username: (optional) the username the webhook should have
-        :param avatar_url: (optional) the avatar url the webhook should have"""
-        self.webhook_url = webhook_url
-        self.username = username
-        self.avatar_url = avatar_url
-        self.check_webhook(str(webhook_url))
+        :param avatar_url: (optional) the avatar url the webhook should have
+        :param session: (optional) a :class:`requests.Session`, or :class:`httpx.Client` when ``http2`` is set, to share between clients
+        :param validate: (optional) check the webhook in the background on construction. The first send waits for the result. Defaults to `False`.
+        :param http2: (optional) send over HTTP/2 with ``httpx`` instead of ``requests``. Defaults to `False`."""
+        super().__init__(webhook_url, username, avatar_url)
+        self._http2 = http2
+        self._owns_session = session is None
+        if http2:
+            if httpx is None:
+                raise WebhookError('httpx is required to use HTTP/2: pip install webhook-client[http2]')
+            self._session = session if session is not None else _build_http2_client()
+        else:
+            self._session = session if session is not None else _build_session()
+        self._invalid = False
+        self._validate_lock = threading.Lock()
+        self._validate_future = _VALIDATE_EXECUTOR.submit(self.check_webhook, str(webhook_url)) if validate else None
+
+    def _wait_validated(self):
+        """ Wait for the background webhook check once and record its outcome.
+        A failed check makes every later send raise :class:`InvalidWebhook`; if the check
+        times out or hits a network error, sends go ahead and ``send`` checks the response. """
+        with self._validate_lock:
+            future = self._validate_future
+            if future is None:
+                return
+            try:
+                future.result(timeout=_VALIDATE_TIMEOUT)
+            except InvalidWebhook:
+                self._invalid = True
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+            except _TRANSPORT_ERRORS:
+                pass
+            self._validate_future = None
+
+    def close(self):
+        """ Flush any batched messages, then close the underlying session unless it was passed in as ``session``. """
+        try:
+            self.flush()
+        finally:
+            if self._owns_session:
+                self._session.close()
+
+    def send_batched(self, content: str = None, embeds: list = None, thread_id: int = None, flush_after_ms: int = 50, max_embeds: int = MAX_EMBEDS):
+        """ Buffer a message to be sent with others in one request.
+        Contents are joined with newlines, starting a new request rather than exceeding Discord's limits.
+        Errors from the timed background flush are raised by the next call; call :meth:`flush` or :meth:`close` before exiting.
+
+
+        content: :class:`str`
+            The content for the message.
+        embeds: :class:`list`
+            List of `Embed`s to send in the message.
+        thread_id: :class:`int`
+            The thread ID that the webhook should be posted in. Defaults to `None`.
+        flush_after_ms: :class:`int`
+            How long to wait for more messages before sending. Defaults to `50`.
+        max_embeds: :class:`int`
+            Send as soon as this many embeds are buffered. Capped at and defaults to `10`. """
+        error = self._take_flush_error()
+        if error is not None:
+            raise error
+        for batch_content, batch_embeds, batch_thread in self._queue(content, embeds, thread_id, max_embeds):
+            self.send(batch_content, embeds=batch_embeds, thread_id=batch_thread)
+        with self._pending_lock:
+            if self._batch_depth or self._flush_timer is not None or not self._pending:
+                return
+            self._flush_timer = threading.Timer(flush_after_ms / 1000, self._background_flush)
+            self._flush_timer.start()
+
+    def _background_flush(self):
+        try:
+            self.flush()
+        except Exception as error:
+            self._flush_error = error
+
+    def flush(self):
+        """ Send every message buffered by :meth:`send_batched`, then raise any error from an earlier background flush. """
+        for batch_content, batch_embeds, batch_thread in self._drain():
+            self.send(batch_content, embeds=batch_embeds, thread_id=batch_thread)
+        error = self._take_flush_error()
+        if error is not None:
+            raise error
+
+    @contextmanager
+    def batch(self):
+        """ Buffer every :meth:`send_batched` call made inside the ``with`` block and flush them on exit. """
+        self._enter_batch()
+        try:
+            yield self
+        finally:
+            if self._exit_batch():
+                self.flush()
 
     def check_webhook(self, webhook_url):
-        r = requests.get(str(webhook_url))
+        if self._http2:
+            r = self._session.head(str(webhook_url), follow_redirects=False)
+        else:
+            r = self._session.head(str(webhook_url), allow_redirects=False)
         if r.status_code in [200, 204]:
             pass
         else:
             raise InvalidWebhook('The webhook you provided is invalid.')
 
-    def to_dict(self, embed):
-        if isinstance(embed, (dict)):
-            return embed
-        elif isinstance(embed, (Embed)):
-            return embed.to_dict()
-        else:
-            return {'title': 'Invalid Embed.'}
-
-    def build_json(self, webhook_url, content: str = None, embeds: list = None, username: str = None, avatar_url: str = None, tts: bool = False):
-        json_data = {}
-        embed_list = []
-        
-        if embeds:
-            for embed in embeds:
-                embed_list.append(self.to_dict(embed))
-        else:
-            embed_data = {'embeds': None}
-        
-        json_data['content'] = content
-        json_data['embeds'] = embed_list
-        json_data['username'] = username
-        json_data['avatar_url'] = avatar_url
-        json_data['tts'] = tts
-
-        return json_data
-    
-    def build_query(self, webhook_url: str, thread_id: int = None):
-        base_url = f"{webhook_url}"
-        if thread_id:
-            base_url += f"?thread_id={str(thread_id)}"
-        return str(base_url)
-
     def send(self, content: str = None, embeds: list = None, tts: bool = False, thread_id: int = None):
         """ Send a message to your WebhookClient.
         
@@ -68,7 +171,34 @@ class WebhookClient:
         tts: :class:`bool`
             Whether or not the message should be sent as text-to-speech. Defaults to `False`.
         thread_id: :class:`int`
-            The thread ID that the webhook should be posted in. Defaults to `None`. """
+            The thread ID that the webhook should be posted in. Defaults to `None`.
+
+        Rate limited requests are retried after the delay Discord asks for, raising
+        :class:`RateLimited` if they are still limited after 3 retries. """
+        if self._validate_future is not None:
+            self._wait_validated()
+        if self._invalid:
+            raise InvalidWebhook('The webhook you provided is invalid.')
         json_data = self.build_json(self.webhook_url, content, embeds, self.username, self.avatar_url, tts)
         query_str = self.build_query(self.webhook_url, thread_id)
-        r = requests.post(str(query_str), json=json_data)
\ No newline at end of file
+        body = _to_json(json_data)
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            delay = self._bucket_delay(query_str)
+            if delay:
+                time.sleep(delay)
+            if self._http2:
+                r = self._session.post(query_str, content=body, headers=_JSON_HEADERS)
+            else:
+                r = self._session.post(query_str, data=body, headers=_JSON_HEADERS)
+            self._update_bucket(query_str, r.headers)
+            if r.status_code != 429:
+                break
+            if attempt == _RATE_LIMIT_RETRIES:
+                raise RateLimited('The webhook is being rate limited.')
+            try:
+                data = r.json()
+            except ValueError:
+                data = None
+            time.sleep(self._retry_after(r.headers, data))
+        if r.status_code in _INVALID_STATUSES:
+            raise InvalidWebhook('The webhook you provided is invalid.')
\ No newline at end of file
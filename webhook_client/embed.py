@@ -1,20 +1,16 @@
 import datetime
-from typing import Any, Dict, Final, List, Mapping, Protocol, TYPE_CHECKING, Type, TypeVar, Union
+from typing import Any, Dict, Final, List, Mapping, Optional, Protocol, TYPE_CHECKING, Type, TypeVar, Union
 from .colour import Colour
 from .types import EmbedType
 
-class _EmptyEmbed:
-    def __bool__(self) -> bool:
-        return False
-
-    def __repr__(self) -> str:
-        return 'Embed.Empty'
-
-    def __len__(self) -> int:
-        return 0
+# Deprecated: empty values are now ``None``. Kept so existing imports keep working.
+EmptyEmbed: Final = None
 
+_NESTED_KEYS = ('footer', 'image', 'thumbnail', 'video', 'provider', 'author')
 
-EmptyEmbed: Final = _EmptyEmbed()
+def _to_str(value: Any) -> str:
+    """ Coerce a value to :class:`str`, skipping the call when it already is one. """
+    return value if value.__class__ is str else str(value)
 
 class Embed:
     """Represents a Discord embed.
@@ -33,15 +29,17 @@ class Embed:
         datetime with the local timezone.
     colour: Union[:class:`Colour`, :class:`int`]
         The colour code of the embed. Aliased to ``color`` as well.
+        Assign a new colour to change it; mutating the :class:`Colour`
+        in place is not picked up by the cached :meth:`to_dict` result.
     Empty
-        A special sentinel value used by ``EmbedProxy`` and this class
-        to denote that the value or attribute is empty.
+        Deprecated alias for ``None``, which denotes that the value or
+        attribute is empty.
     """
 
     __slots__ = (
-        'title',
-        'url',
-        'type',
+        '_title',
+        '_url',
+        '_type',
         '_timestamp',
         '_colour',
         '_footer',
@@ -51,37 +49,31 @@ class Embed:
         '_provider',
         '_author',
         '_fields',
-        'description',
+        '_description',
+        '_cached_dict',
     )
 
-    Empty: Final = EmptyEmbed
+    Empty: Final = None
 
     def __init__(
         self,
         *,
-        colour: Union[int, Colour, _EmptyEmbed] = EmptyEmbed,
-        color: Union[int, Colour, _EmptyEmbed] = EmptyEmbed,
-        title: str = EmptyEmbed,
+        colour: Optional[Union[int, Colour]] = None,
+        color: Optional[Union[int, Colour]] = None,
+        title: Optional[str] = None,
         type: EmbedType = 'rich',
-        url: str = EmptyEmbed,
-        description: str = EmptyEmbed,
-        timestamp: datetime.datetime = None,
+        url: Optional[str] = None,
+        description: Optional[str] = None,
+        timestamp: Optional[datetime.datetime] = None,
     ):
 
+        # Write the slots directly; the property setters would clear the cache once per field.
+        self._cached_dict = None
         self.colour = colour if colour else color
-        self.title = title
-        self.type = type
-        self.url = url
-        self.description = description
-
-        if self.title is not EmptyEmbed:
-            self.title = str(self.title)
-
-        if self.description is not EmptyEmbed:
-            self.description = str(self.description)
-
-        if self.url is not EmptyEmbed:
-            self.url = str(self.url)
+        self._title = None if title is None else _to_str(title)
+        self._type = type
+        self._url = None if url is None else _to_str(url)
+        self._description = None if description is None else _to_str(description)
 
         if timestamp:
             self.timestamp = timestamp
@@ -100,29 +92,36 @@ class Embed:
         """
         # we are bypassing __init__ here since it doesn't apply here
         self = cls.__new__(cls)
+        self._cached_dict = None
 
         # fill in the basic fields
 
         self.title = data.get('title', None)
-        self.type = data.get('type', None)
+        self.type = data.get('type', 'rich')
         self.description = data.get('description', None)
         self.url = data.get('url', None)
 
-        if self.title:
-            self.title = str(self.title)
-
-        if self.description:
-            self.description = str(self.description)
-
-        if self.url:
-            self.url = str(self.url)
-
         try:
             self._colour = Colour(value=data['color'])
         except KeyError:
             pass
 
-        for attr in ('thumbnail', 'video', 'provider', 'author', 'fields', 'image', 'footer'):
+        fields = []
+        for field in data.get('fields') or ():
+            # skip malformed fields rather than dropping them all
+            try:
+                fields.append({**field, 'name': field['name'], 'value': field['value']})
+            except (KeyError, TypeError):
+                continue
+        if fields:
+            self._fields = fields
+
+        try:
+            self._footer = dict(data['footer'])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        for attr in ('thumbnail', 'video', 'provider', 'author', 'image'):
             try:
                 value = data[attr]
             except KeyError:
@@ -137,7 +136,7 @@ class Embed:
         return self.__class__.from_dict(self.to_dict())
 
     def __len__(self) -> int:
-        total = len(self.title) + len(self.description)
+        total = len(self.title or '') + len(self.description or '')
         for field in getattr(self, '_fields', []):
             total += len(field['name']) + len(field['value'])
 
@@ -146,7 +145,7 @@ class Embed:
         except (AttributeError, KeyError):
             pass
         else:
-            total += len(footer_text)
+            total += len(footer_text or '')
 
         try:
             author = self._author
@@ -175,9 +174,45 @@ class Embed:
             )
         )
 
+    @property
+    def title(self):
+        return getattr(self, '_title', None)
+
+    @title.setter
+    def title(self, value: Optional[str]):
+        self._title = None if value is None else _to_str(value)
+        self._cached_dict = None
+
+    @property
+    def description(self):
+        return getattr(self, '_description', None)
+
+    @description.setter
+    def description(self, value: Optional[str]):
+        self._description = None if value is None else _to_str(value)
+        self._cached_dict = None
+
+    @property
+    def url(self):
+        return getattr(self, '_url', None)
+
+    @url.setter
+    def url(self, value: Optional[str]):
+        self._url = None if value is None else _to_str(value)
+        self._cached_dict = None
+
+    @property
+    def type(self):
+        return getattr(self, '_type', None)
+
+    @type.setter
+    def type(self, value: EmbedType):
+        self._type = value
+        self._cached_dict = None
+
     @property
     def colour(self):
-        return getattr(self, '_colour', EmptyEmbed)
+        return getattr(self, '_colour', None)
 
     @colour.setter
     def colour(self, value: Union[int, Colour]):  # type: ignore
@@ -187,12 +222,13 @@ class Embed:
             self._colour = Colour(value=value)
         else:
             self._colour = None
+        self._cached_dict = None
 
     color = colour
 
     @property
     def timestamp(self):
-        return getattr(self, '_timestamp', EmptyEmbed)
+        return getattr(self, '_timestamp', None)
 
     @timestamp.setter
     def timestamp(self, value: datetime.datetime):
@@ -200,10 +236,11 @@ class Embed:
             if value.tzinfo is None:
                 value = value.astimezone()
             self._timestamp = value
-        elif isinstance(value, None):
+        elif value is None:
             self._timestamp = value
         else:
-            raise TypeError(f"Expected datetime.datetime or Embed.Empty received {value.__class__.__name__} instead")
+            raise TypeError(f"Expected datetime.datetime or None received {value.__class__.__name__} instead")
+        self._cached_dict = None
 
     def set_footer(self, *, text: str, icon_url: str = None):
         """Sets the footer for the embed content.
@@ -219,10 +256,12 @@ class Embed:
 
         self._footer = {}
         if text:
-            self._footer['text'] = str(text)
+            self._footer['text'] = _to_str(text)
 
         if icon_url:
-            self._footer['icon_url'] = str(icon_url)
+            self._footer['icon_url'] = _to_str(icon_url)
+
+        self._cached_dict = None
 
         return self
 
@@ -231,7 +270,7 @@ class Embed:
         This function returns the class instance to allow for fluent-style
         chaining.
         .. versionchanged:: 1.4
-            Passing :attr:`Empty` removes the image.
+            Passing ``None`` removes the image.
         Parameters
         -----------
         url: :class:`str`
@@ -245,9 +284,11 @@ class Embed:
                 pass
         else:
             self._image = {
-                'url': str(url),
+                'url': _to_str(url),
             }
 
+        self._cached_dict = None
+
         return self
 
     def set_thumbnail(self, *, url: str = None):
@@ -255,7 +296,7 @@ class Embed:
         This function returns the class instance to allow for fluent-style
         chaining.
         .. versionchanged:: 1.4
-            Passing :attr:`Empty` removes the thumbnail.
+            Passing ``None`` removes the thumbnail.
         Parameters
         -----------
         url: :class:`str`
@@ -269,9 +310,11 @@ class Embed:
                 pass
         else:
             self._thumbnail = {
-                'url': str(url),
+                'url': _to_str(url),
             }
 
+        self._cached_dict = None
+
         return self
 
 
@@ -290,14 +333,16 @@ class Embed:
         """
 
         self._author = {
-            'name': str(name),
+            'name': _to_str(name),
         }
 
         if url:
-            self._author['url'] = str(url)
+            self._author['url'] = _to_str(url)
 
         if icon_url:
-            self._author['icon_url'] = str(icon_url)
+            self._author['icon_url'] = _to_str(icon_url)
+
+        self._cached_dict = None
 
         return self
 
@@ -317,47 +362,86 @@ class Embed:
 
         field = {
             'inline': inline,
-            'name': str(name),
-            'value': str(value),
+            'name': _to_str(name),
+            'value': _to_str(value),
         }
 
         try:
             self._fields.append(field)
         except AttributeError:
             self._fields = [field]
+        self._cached_dict = None
 
         return self
 
     def to_dict(self):
         """ Convert embed object to dict """
-        result = {
-            key[1:]: getattr(self, key)
-            for key in self.__slots__
-            if key[0] == '_' and hasattr(self, key)
-        }
+        result = dict(self._to_dict())
+        for key in _NESTED_KEYS:
+            try:
+                result[key] = dict(result[key])
+            except KeyError:
+                pass
         try:
-            colour = result.pop('colour')
+            result['fields'] = [dict(field) for field in result['fields']]
         except KeyError:
             pass
-        else:
-            if colour:
-                result['color'] = colour.value
+        return result
+
+    def _to_dict(self):
+        """ The serialized embed, cached until a setter or ``set_*``/``add_field`` changes it.
+        It is shared with the cache, so callers must not mutate it. """
         try:
-            timestamp = result.pop('timestamp')
-        except KeyError:
-            pass
-        else:
-            if timestamp:
-                if timestamp.tzinfo:
-                    result['timestamp'] = timestamp.astimezone(tz=datetime.timezone.utc).isoformat()
-                else:
-                    result['timestamp'] = timestamp.replace(tzinfo=datetime.timezone.utc).isoformat()
-        if self.type:
-            result['type'] = self.type
-        if self.description:
-            result['description'] = self.description
-        if self.url:
-            result['url'] = self.url
-        if self.title:
-            result['title'] = self.title
+            cached = self._cached_dict
+        except AttributeError:
+            cached = None
+        if cached is not None:
+            return cached
+
+        # getattr with a default avoids raising AttributeError for every slot that was never set.
+        result = {}
+        footer = getattr(self, '_footer', None)
+        if footer is not None:
+            result['footer'] = footer
+        image = getattr(self, '_image', None)
+        if image is not None:
+            result['image'] = image
+        thumbnail = getattr(self, '_thumbnail', None)
+        if thumbnail is not None:
+            result['thumbnail'] = thumbnail
+        video = getattr(self, '_video', None)
+        if video is not None:
+            result['video'] = video
+        provider = getattr(self, '_provider', None)
+        if provider is not None:
+            result['provider'] = provider
+        author = getattr(self, '_author', None)
+        if author is not None:
+            result['author'] = author
+        fields = getattr(self, '_fields', None)
+        if fields is not None:
+            result['fields'] = fields
+        colour = getattr(self, '_colour', None)
+        if colour:
+            result['color'] = colour.value
+        timestamp = getattr(self, '_timestamp', None)
+        if timestamp:
+            if timestamp.tzinfo:
+                result['timestamp'] = timestamp.astimezone(tz=datetime.timezone.utc).isoformat()
+            else:
+                result['timestamp'] = timestamp.replace(tzinfo=datetime.timezone.utc).isoformat()
+        # Discord treats embeds without a type as rich, so the default is left out.
+        type = getattr(self, '_type', None)
+        if type and type != 'rich':
+            result['type'] = type
+        description = self.description
+        if description:
+            result['description'] = description
+        url = self.url
+        if url:
+            result['url'] = url
+        title = self.title
+        if title:
+            result['title'] = title
+        self._cached_dict = result
         return result
\ No newline at end of file
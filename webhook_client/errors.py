@@ -5,4 +5,9 @@ class WebhookError(Exception):
 
 class InvalidWebhook(WebhookError):
     """ Raised when an invalid webhook is provided for the WebhookClient instance. """
+    pass
+
+
+class RateLimited(WebhookError):
+    """ Raised when Discord keeps rate limiting a message after it has been retried. """
     pass
\ No newline at end of file